@@ -1,9 +1,16 @@
 """
 FastAPI application for the Airflow mock API.
 """
+import asyncio
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, AsyncIterator, Callable, Dict, Hashable, List, Optional
+import pydantic_core
 from fastapi import FastAPI, HTTPException, Header, Query, Body, Path
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel, TypeAdapter
 from .models import (
     DAG, DAGCollection,
     DAGRun, DAGRunCollection,
@@ -14,41 +21,157 @@ from .models import (
     Pool, PoolCollection,
     Provider, ProviderCollection, ProviderHook
 )
-from .store import store
+from .store import PaginationError, store
+from .sample_data import populate_instance
+
+class ModelJSONResponse(JSONResponse):
+    """JSON response rendered by pydantic-core, which serializes models, datetimes and ints of any size."""
+
+    def render(self, content: Any) -> bytes:
+        return pydantic_core.to_json(content)
+
+class _NowCache:
+    """UTC ISO-8601 timestamp that is re-formatted at most once per refresh interval."""
+
+    __slots__ = ("_interval", "_expires_at", "_value")
+
+    def __init__(self, interval: float = 0.1):
+        self._interval = interval
+        self._expires_at = 0.0
+        self._value = ""
+
+    def isoformat(self) -> str:
+        """Get the current time, at most one refresh interval stale."""
+        now = time.monotonic()
+        if now >= self._expires_at:
+            self._value = datetime.utcnow().isoformat()
+            self._expires_at = now + self._interval
+        return self._value
+
+_now = _NowCache()
+
+# Prebuilt serializers for the largest list responses
+_DAG_RUN_LIST = TypeAdapter(List[DAGRun])
+_TASK_INSTANCE_LIST = TypeAdapter(List[TaskInstance])
+
+def _list_body(field: str, items_json: bytes, total: int) -> bytes:
+    """Wrap an already serialized JSON array in a collection envelope."""
+    return b'{"%s":%s,"total_entries":%d}' % (field.encode(), items_json, total)
+
+# Known task states, mapped to one shared string object each so that states
+# parsed from request bodies don't keep a separate copy per task instance
+_TASK_STATES = {
+    s: s
+    for s in ("running", "success", "failed", "skipped", "queued", "up_for_retry", "upstream_failed", "scheduled", "none")
+}
+_FINISHED_STATES = frozenset(("success", "failed", "skipped"))
+
+# Task instance action messages, prebuilt for the known states
+_STATE_MSGS = {s: f"Task instance state set to {s}" for s in _TASK_STATES}
+_CLEARED_MSG = "Task instance cleared"
+_NOT_CLEARED_MSG = "Task instance not cleared (dry run or filter conditions not met)"
+
+class _ResponseCache:
+    """Bounded LRU of rendered JSON bodies.
+
+    Keys include the store version of the collection they were rendered from,
+    so a mutation makes old entries unreachable and they age out.
+    """
+
+    __slots__ = ("_maxsize", "_entries")
+
+    def __init__(self, maxsize: int = 256):
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, bytes]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        """Get a cached body, marking it as recently used."""
+        body = self._entries.get(key)
+        if body is not None:
+            self._entries.move_to_end(key)
+        return body
+
+    def put(self, key: Hashable, body: bytes) -> None:
+        """Cache a body, evicting the least recently used entry when full."""
+        self._entries[key] = body
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+def _require(items: Dict[str, Any], key: str, detail: str) -> Any:
+    """Look up an object in a store collection, raising a 404 if it is missing."""
+    try:
+        return items[key]
+    except KeyError:
+        raise HTTPException(status_code=404, detail=detail) from None
+
+def _next_cursor(items: List[Any], limit: Optional[int], key_attr: str) -> Optional[str]:
+    """Get the cursor for the page after a full keyset page, or None after the last one."""
+    if not items or limit is None or len(items) < limit:
+        return None
+    return getattr(items[-1], key_attr)
+
+CURSOR_QUERY = Query(
+    None,
+    description="Return items whose key sorts after this cursor; pass an empty value to start keyset pagination",
+)
+
+def create_app(instance_id: str, populate: bool = False) -> FastAPI:
+    """Create a FastAPI application for a specific Airflow instance.
 
-def create_app(instance_id: str) -> FastAPI:
-    """Create a FastAPI application for a specific Airflow instance."""
-    app = FastAPI(title=f"Airflow Mock API - Instance {instance_id}")
+    With populate set, sample data is loaded during startup, before the
+    server accepts connections.
+    """
     instance_store = store.get_instance(instance_id)
 
-    @app.get("/health")
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        if populate:
+            # Generate off the event loop so startup stays responsive to signals
+            await asyncio.to_thread(populate_instance, instance_store)
+        yield
+
+    app = FastAPI(title=f"Airflow Mock API - Instance {instance_id}", lifespan=lifespan)
+    response_cache = _ResponseCache()
+
+    def cached_json(collection: str, params: tuple, build: Callable[[], BaseModel]) -> Response:
+        """Serve a collection response, rendering it only if the collection changed."""
+        key = (collection, instance_store.version(collection)) + params
+        body = response_cache.get(key)
+        if body is None:
+            body = build().model_dump_json().encode()
+            response_cache.put(key, body)
+        return Response(content=body, media_type="application/json")
+
+    @app.get("/health", response_class=ModelJSONResponse)
     async def health_check():
         """Check the health of the API."""
         return {
             "status": "healthy",
             "instance_id": instance_id,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _now.isoformat(),
             "version": "1.0.0"
         }
 
     @app.get("/api/v1/dags", response_model=DAGCollection)
     async def list_dags(
         limit: int = Query(100, ge=1),
-        offset: int = Query(0, ge=0)
-    ) -> DAGCollection:
+        offset: int = Query(0, ge=0),
+        cursor: Optional[str] = CURSOR_QUERY
+    ) -> Response:
         """List DAGs."""
-        dags = list(instance_store.dags.values())
-        total = len(dags)
-        dags = dags[offset:offset + limit]
-        return DAGCollection(dags=dags, total_entries=total)
+        def build() -> DAGCollection:
+            dags, total = instance_store.list_dags(limit=limit, offset=offset, cursor=cursor)
+            return DAGCollection.model_construct(
+                dags=dags, total_entries=total, next_cursor=_next_cursor(dags, limit, "dag_id")
+            )
+        return cached_json("dags", (limit, offset, cursor), build)
 
     @app.get("/api/v1/dags/{dag_id}", response_model=DAG)
-    async def get_dag(dag_id: str) -> DAG:
+    async def get_dag(dag_id: str) -> ModelJSONResponse:
         """Get a specific DAG."""
-        dag = instance_store.get_dag(dag_id)
-        if not dag:
-            raise HTTPException(status_code=404, detail="DAG not found")
-        return dag
+        dag = _require(instance_store.dags, dag_id, "DAG not found")
+        return ModelJSONResponse(dag)
 
     @app.get("/api/v1/dags/{dag_id}/dagRuns", response_model=DAGRunCollection)
     async def list_dag_runs(
@@ -58,30 +181,24 @@ def create_app(instance_id: str) -> FastAPI:
         execution_date_gte: Optional[datetime] = None,
         execution_date_lte: Optional[datetime] = None,
         state: Optional[str] = None
-    ) -> DAGRunCollection:
+    ) -> Response:
         """List DAG runs."""
-        if dag_id not in instance_store.dag_runs:
-            return DAGRunCollection(dag_runs=[], total_entries=0)
-            
-        dag_runs = list(instance_store.dag_runs[dag_id].values())
-        
-        # Apply filters
-        if execution_date_gte:
-            dag_runs = [dr for dr in dag_runs if dr.execution_date >= execution_date_gte]
-        if execution_date_lte:
-            dag_runs = [dr for dr in dag_runs if dr.execution_date <= execution_date_lte]
-        if state:
-            dag_runs = [dr for dr in dag_runs if dr.state == state]
-            
-        total = len(dag_runs)
-        dag_runs = dag_runs[offset:offset + limit]
-        return DAGRunCollection(dag_runs=dag_runs, total_entries=total)
+        dag_runs, total = instance_store.list_dag_runs(
+            dag_id,
+            limit=limit,
+            offset=offset,
+            execution_date_gte=execution_date_gte,
+            execution_date_lte=execution_date_lte,
+            state=state,
+        )
+        body = _list_body("dag_runs", _DAG_RUN_LIST.dump_json(dag_runs), total)
+        return Response(content=body, media_type="application/json")
 
     @app.post("/api/v1/dags/{dag_id}/dagRuns", response_model=DAGRun)
     async def create_dag_run(
         dag_id: str,
         dag_run: DAGRun = Body(...)
-    ) -> DAGRun:
+    ) -> ModelJSONResponse:
         """Create a DAG run."""
         if dag_id not in instance_store.dags:
             raise HTTPException(status_code=404, detail="DAG not found")
@@ -89,33 +206,35 @@ def create_app(instance_id: str) -> FastAPI:
         # Ensure dag_id matches the URL
         dag_run.dag_id = dag_id
         
+        now = datetime.utcnow()
+
         # Generate run_id if not provided
         if not dag_run.run_id:
-            dag_run.run_id = f"manual__{datetime.utcnow().strftime('%Y-%m-%dT%H:%M:%S')}"
+            dag_run.run_id = f"manual__{now.strftime('%Y-%m-%dT%H:%M:%S')}"
             
         # Set defaults if not provided
         if not dag_run.execution_date:
-            dag_run.execution_date = datetime.utcnow()
+            dag_run.execution_date = now
         if not dag_run.start_date:
-            dag_run.start_date = datetime.utcnow()
+            dag_run.start_date = now
             
         instance_store.add_dag_run(dag_run)
-        return dag_run
+        return ModelJSONResponse(dag_run)
 
     @app.get("/api/v1/dags/{dag_id}/dagRuns/{run_id}", response_model=DAGRun)
-    async def get_dag_run(dag_id: str, run_id: str) -> DAGRun:
+    async def get_dag_run(dag_id: str, run_id: str) -> ModelJSONResponse:
         """Get a specific DAG run."""
         dag_run = instance_store.get_dag_run(dag_id, run_id)
         if not dag_run:
             raise HTTPException(status_code=404, detail="DAG run not found")
-        return dag_run
+        return ModelJSONResponse(dag_run)
 
     @app.patch("/api/v1/dags/{dag_id}/dagRuns/{run_id}", response_model=DAGRun)
     async def update_dag_run(
         dag_id: str,
         run_id: str,
         dag_run: DAGRun = Body(...)
-    ) -> DAGRun:
+    ) -> ModelJSONResponse:
         """Update a DAG run."""
         existing_run = instance_store.get_dag_run(dag_id, run_id)
         if not existing_run:
@@ -125,7 +244,7 @@ def create_app(instance_id: str) -> FastAPI:
         dag_run.dag_id = dag_id
         dag_run.run_id = run_id
         instance_store.add_dag_run(dag_run)
-        return dag_run
+        return ModelJSONResponse(dag_run)
 
     @app.get("/api/v1/dags/{dag_id}/dagRuns/{run_id}/taskInstances", response_model=TaskInstanceCollection)
     async def list_task_instances(
@@ -136,29 +255,25 @@ def create_app(instance_id: str) -> FastAPI:
         execution_date_gte: Optional[datetime] = None,
         execution_date_lte: Optional[datetime] = None,
         state: Optional[str] = None,
-    ) -> TaskInstanceCollection:
+    ) -> Response:
         """List task instances for a DAG run."""
-        task_instances = instance_store.get_task_instances(dag_id, run_id)
-        
-        # Apply filters
-        if state:
-            task_instances = [ti for ti in task_instances if ti.state == state]
-            
-        total = len(task_instances)
-        task_instances = task_instances[offset:offset + limit]
-        return TaskInstanceCollection(task_instances=task_instances, total_entries=total)
+        task_instances, total = instance_store.list_task_instances(
+            dag_id, run_id, limit=limit, offset=offset, state=state
+        )
+        body = _list_body("task_instances", _TASK_INSTANCE_LIST.dump_json(task_instances), total)
+        return Response(content=body, media_type="application/json")
 
     @app.get("/api/v1/dags/{dag_id}/dagRuns/{run_id}/taskInstances/{task_id}", response_model=TaskInstance)
     async def get_task_instance(
         dag_id: str,
         run_id: str,
         task_id: str
-    ) -> TaskInstance:
+    ) -> ModelJSONResponse:
         """Get a specific task instance."""
         task_instance = instance_store.get_task_instance(dag_id, run_id, task_id)
         if not task_instance:
             raise HTTPException(status_code=404, detail="Task instance not found")
-        return task_instance
+        return ModelJSONResponse(task_instance)
 
     @app.post("/api/v1/dags/{dag_id}/dagRuns/{run_id}/taskInstances/{task_id}/setTaskInstanceState", response_model=TaskInstanceActionResponse)
     async def set_task_instance_state(
@@ -166,33 +281,37 @@ def create_app(instance_id: str) -> FastAPI:
         run_id: str,
         task_id: str,
         state: str = Body(..., embed=True)
-    ) -> TaskInstanceActionResponse:
+    ) -> ModelJSONResponse:
         """Set the state of a task instance."""
         task_instance = instance_store.get_task_instance(dag_id, run_id, task_id)
         if not task_instance:
             raise HTTPException(status_code=404, detail="Task instance not found")
             
         # Update task instance state
+        now = datetime.utcnow()
+        state = _TASK_STATES.get(state, state)
         task_instance.state = state
         if state == "running":
-            task_instance.start_date = datetime.utcnow()
+            task_instance.start_date = now
             task_instance.end_date = None
-        elif state in ["success", "failed", "skipped"]:
+        elif state in _FINISHED_STATES:
             if not task_instance.start_date:
-                task_instance.start_date = datetime.utcnow()
-            task_instance.end_date = datetime.utcnow()
+                task_instance.start_date = now
+            task_instance.end_date = now
             if task_instance.start_date:
                 task_instance.duration = (task_instance.end_date - task_instance.start_date).total_seconds()
                 
         instance_store.add_task_instance(task_instance)
         
-        return TaskInstanceActionResponse(
+        message = _STATE_MSGS.get(state) or f"Task instance state set to {state}"
+        response = TaskInstanceActionResponse.model_construct(
             task_id=task_id,
             dag_id=dag_id,
             run_id=run_id,
             state=state,
-            message=f"Task instance state set to {state}"
+            message=message
         )
+        return ModelJSONResponse(response)
 
     @app.post("/api/v1/dags/{dag_id}/dagRuns/{run_id}/taskInstances/{task_id}/clearTaskInstance", response_model=TaskInstanceActionResponse)
     async def clear_task_instance(
@@ -200,7 +319,7 @@ def create_app(instance_id: str) -> FastAPI:
         run_id: str,
         task_id: str,
         clear_request: ClearTaskInstance = Body(...)
-    ) -> TaskInstanceActionResponse:
+    ) -> ModelJSONResponse:
         """Clear a task instance."""
         task_instance = instance_store.get_task_instance(dag_id, run_id, task_id)
         if not task_instance:
@@ -215,17 +334,18 @@ def create_app(instance_id: str) -> FastAPI:
             
         if should_clear and not clear_request.dry_run:
             instance_store.clear_task_instance(task_instance)
-            message = "Task instance cleared"
+            message = _CLEARED_MSG
         else:
-            message = "Task instance not cleared (dry run or filter conditions not met)"
+            message = _NOT_CLEARED_MSG
             
-        return TaskInstanceActionResponse(
+        response = TaskInstanceActionResponse.model_construct(
             task_id=task_id,
             dag_id=dag_id,
             run_id=run_id,
             state=task_instance.state,
             message=message
         )
+        return ModelJSONResponse(response)
 
     @app.get("/api/v1/dags/{dag_id}/dagRuns/{run_id}/taskInstances/{task_id}/logs/{try_number}", response_model=TaskLog)
     async def get_task_logs(
@@ -233,145 +353,122 @@ def create_app(instance_id: str) -> FastAPI:
         run_id: str,
         task_id: str,
         try_number: int = Path(..., ge=1)
-    ) -> TaskLog:
+    ) -> ModelJSONResponse:
         """Get logs for a task instance."""
         task_log = instance_store.get_task_log(dag_id, run_id, task_id, try_number)
         if not task_log:
-            # If no logs exist, create a default log message
-            task_log = TaskLog(
+            # If no logs exist, answer with a placeholder without storing it,
+            # so probing missing logs never grows the store
+            task_log = TaskLog.model_construct(
                 try_number=try_number,
                 content=f"No logs found for task {task_id} (try {try_number})",
                 timestamp=datetime.utcnow()
             )
-            instance_store.add_task_log(dag_id, run_id, task_id, try_number, task_log)
-        return task_log
+        return ModelJSONResponse(task_log)
 
     @app.get("/api/v1/dags/{dag_id}/dagRuns/{run_id}/taskInstances/{task_id}/xcomEntries", response_model=XComCollection)
     async def list_xcom_entries(
         dag_id: str,
         run_id: str,
         task_id: str,
-        key: Optional[str] = None,
-        instance_id: str = "default"
-    ) -> XComCollection:
+        key: Optional[str] = None
+    ) -> Response:
         """List XCom entries for a task instance."""
-        store = get_store(instance_id)
-        xcom_entries = store.list_xcom_values(dag_id=dag_id, task_id=task_id, run_id=run_id, key=key)
-        return XComCollection(xcom_entries=xcom_entries, total_entries=len(xcom_entries))
+        def build() -> XComCollection:
+            xcom_entries = instance_store.list_xcom_values(dag_id=dag_id, task_id=task_id, run_id=run_id, key=key)
+            return XComCollection.model_construct(xcom_entries=xcom_entries, total_entries=len(xcom_entries))
+
+        return cached_json("xcoms", (dag_id, run_id, task_id, key), build)
 
     @app.get("/api/v1/dags/{dag_id}/dagRuns/{run_id}/taskInstances/{task_id}/xcomEntries/{key}", response_model=XCom)
     async def get_xcom_entry(
         dag_id: str,
         run_id: str,
         task_id: str,
-        key: str,
-        instance_id: str = "default"
-    ) -> XCom:
+        key: str
+    ) -> ModelJSONResponse:
         """Get a specific XCom entry."""
-        store = get_store(instance_id)
-        xcom = store.get_xcom_value(dag_id=dag_id, task_id=task_id, key=key, run_id=run_id)
+        xcom = instance_store.get_xcom_value(dag_id=dag_id, task_id=task_id, key=key, run_id=run_id)
         if not xcom:
             raise HTTPException(status_code=404, detail=f"XCom entry not found")
-        return xcom
+        return ModelJSONResponse(xcom)
 
     @app.post("/api/v1/dags/{dag_id}/dagRuns/{run_id}/taskInstances/{task_id}/xcomEntries", response_model=XCom)
     async def create_xcom_entry(
         dag_id: str,
         run_id: str,
         task_id: str,
-        xcom: XCom,
-        instance_id: str = "default"
-    ) -> XCom:
+        xcom: XCom
+    ) -> ModelJSONResponse:
         """Create an XCom entry."""
-        store = get_store(instance_id)
         # Ensure the provided IDs match the URL parameters
         xcom.dag_id = dag_id
         xcom.run_id = run_id
         xcom.task_id = task_id
-        store.add_xcom_value(xcom)
-        return xcom
+        instance_store.add_xcom_value(xcom)
+        return ModelJSONResponse(xcom)
 
     @app.delete("/api/v1/dags/{dag_id}/dagRuns/{run_id}/taskInstances/{task_id}/xcomEntries/{key}", status_code=204)
     async def delete_xcom_entry(
         dag_id: str,
         run_id: str,
         task_id: str,
-        key: str,
-        instance_id: str = "default"
+        key: str
     ) -> None:
         """Delete an XCom entry."""
-        store = get_store(instance_id)
-        if not store.delete_xcom_value(dag_id=dag_id, task_id=task_id, key=key, run_id=run_id):
+        if not instance_store.delete_xcom_value(dag_id=dag_id, task_id=task_id, key=key, run_id=run_id):
             raise HTTPException(status_code=404, detail=f"XCom entry not found")
 
     @app.get("/api/v1/connections", response_model=ConnectionCollection)
     async def list_connections(
-        limit: Optional[int] = 100,
-        offset: Optional[int] = None,
-        instance_id: str = "default"
-    ) -> ConnectionCollection:
+        limit: int = Query(100, ge=1),
+        offset: int = Query(0, ge=0),
+        cursor: Optional[str] = CURSOR_QUERY
+    ) -> Response:
         """List connections."""
-        store = get_store(instance_id)
-        connections = store.list_connections(limit=limit, offset=offset)
-        return ConnectionCollection(
-            connections=connections,
-            total_entries=len(store.list_connections())
-        )
+        def build() -> ConnectionCollection:
+            connections, total = instance_store.list_connections(limit=limit, offset=offset, cursor=cursor)
+            next_cursor = _next_cursor(connections, limit, "conn_id") if cursor is not None else None
+            return ConnectionCollection.model_construct(
+                connections=connections, total_entries=total, next_cursor=next_cursor
+            )
+        return cached_json("connections", (limit, offset, cursor), build)
 
     @app.get("/api/v1/connections/{conn_id}", response_model=Connection)
-    async def get_connection(
-        conn_id: str,
-        instance_id: str = "default"
-    ) -> Connection:
+    async def get_connection(conn_id: str) -> ModelJSONResponse:
         """Get a specific connection."""
-        store = get_store(instance_id)
-        connection = store.get_connection(conn_id)
-        if not connection:
-            raise HTTPException(status_code=404, detail=f"Connection {conn_id} not found")
-        return connection
+        connection = _require(instance_store.connections, conn_id, f"Connection {conn_id} not found")
+        return ModelJSONResponse(connection)
 
     @app.post("/api/v1/connections", response_model=Connection)
-    async def create_connection(
-        connection: Connection,
-        instance_id: str = "default"
-    ) -> Connection:
+    async def create_connection(connection: Connection) -> ModelJSONResponse:
         """Create a connection."""
-        store = get_store(instance_id)
-        # Check if connection already exists
-        if store.get_connection(connection.conn_id):
+        if not instance_store.create_connection(connection):
             raise HTTPException(
                 status_code=409,
                 detail=f"Connection {connection.conn_id} already exists"
             )
-        store.add_connection(connection)
-        return connection
+        return ModelJSONResponse(connection)
 
     @app.patch("/api/v1/connections/{conn_id}", response_model=Connection)
     async def update_connection(
         conn_id: str,
-        connection: Connection,
-        instance_id: str = "default"
-    ) -> Connection:
+        connection: Connection
+    ) -> ModelJSONResponse:
         """Update a connection."""
-        store = get_store(instance_id)
-        if not store.get_connection(conn_id):
+        # Ensure conn_id matches URL parameter
+        connection.conn_id = conn_id
+        if not instance_store.update_connection(connection):
             raise HTTPException(
                 status_code=404,
                 detail=f"Connection {conn_id} not found"
             )
-        # Ensure conn_id matches URL parameter
-        connection.conn_id = conn_id
-        store.add_connection(connection)
-        return connection
+        return ModelJSONResponse(connection)
 
     @app.delete("/api/v1/connections/{conn_id}", status_code=204)
-    async def delete_connection(
-        conn_id: str,
-        instance_id: str = "default"
-    ) -> None:
+    async def delete_connection(conn_id: str) -> None:
         """Delete a connection."""
-        store = get_store(instance_id)
-        if not store.delete_connection(conn_id):
+        if not instance_store.delete_connection(conn_id):
             raise HTTPException(
                 status_code=404,
                 detail=f"Connection {conn_id} not found"
@@ -379,73 +476,59 @@ def create_app(instance_id: str) -> FastAPI:
 
     @app.get("/api/v1/variables", response_model=VariableCollection)
     async def list_variables(
-        limit: Optional[int] = 100,
-        offset: Optional[int] = None,
+        limit: int = Query(100, ge=1),
+        offset: int = Query(0, ge=0),
         order_by: Optional[str] = None,
-        instance_id: str = "default"
-    ) -> VariableCollection:
+        cursor: Optional[str] = CURSOR_QUERY
+    ) -> Response:
         """List variables."""
-        store = get_store(instance_id)
-        variables = store.list_variables(limit=limit, offset=offset, order_by=order_by)
-        return VariableCollection(
-            variables=variables,
-            total_entries=len(store.list_variables())
-        )
+        def build() -> VariableCollection:
+            try:
+                variables, total = instance_store.list_variables(
+                    limit=limit, offset=offset, order_by=order_by, cursor=cursor
+                )
+            except PaginationError as exc:
+                raise HTTPException(status_code=400, detail=str(exc)) from None
+            keyset = cursor is not None or order_by == "key"
+            next_cursor = _next_cursor(variables, limit, "key") if keyset else None
+            return VariableCollection.model_construct(variables=variables, total_entries=total, next_cursor=next_cursor)
+        return cached_json("variables", (limit, offset, order_by, cursor), build)
 
     @app.get("/api/v1/variables/{key}", response_model=Variable)
-    async def get_variable(
-        key: str,
-        instance_id: str = "default"
-    ) -> Variable:
+    async def get_variable(key: str) -> ModelJSONResponse:
         """Get a specific variable."""
-        store = get_store(instance_id)
-        variable = store.get_variable(key)
-        if not variable:
-            raise HTTPException(status_code=404, detail=f"Variable {key} not found")
-        return variable
+        variable = _require(instance_store.variables, key, f"Variable {key} not found")
+        return ModelJSONResponse(variable)
 
     @app.post("/api/v1/variables", response_model=Variable)
-    async def create_variable(
-        variable: Variable,
-        instance_id: str = "default"
-    ) -> Variable:
+    async def create_variable(variable: Variable) -> ModelJSONResponse:
         """Create a variable."""
-        store = get_store(instance_id)
-        # Check if variable already exists
-        if store.get_variable(variable.key):
+        if not instance_store.create_variable(variable):
             raise HTTPException(
                 status_code=409,
                 detail=f"Variable {variable.key} already exists"
             )
-        store.add_variable(variable)
-        return variable
+        return ModelJSONResponse(variable)
 
     @app.patch("/api/v1/variables/{key}", response_model=Variable)
     async def update_variable(
         key: str,
-        variable: Variable,
-        instance_id: str = "default"
-    ) -> Variable:
+        variable: Variable
+    ) -> ModelJSONResponse:
         """Update a variable."""
-        store = get_store(instance_id)
-        if not store.get_variable(key):
+        # Ensure key matches URL parameter
+        variable.key = key
+        if not instance_store.update_variable(variable):
             raise HTTPException(
                 status_code=404,
                 detail=f"Variable {key} not found"
             )
-        # Ensure key matches URL parameter
-        variable.key = key
-        store.add_variable(variable)
-        return variable
+        return ModelJSONResponse(variable)
 
     @app.delete("/api/v1/variables/{key}", status_code=204)
-    async def delete_variable(
-        key: str,
-        instance_id: str = "default"
-    ) -> None:
+    async def delete_variable(key: str) -> None:
         """Delete a variable."""
-        store = get_store(instance_id)
-        if not store.delete_variable(key):
+        if not instance_store.delete_variable(key):
             raise HTTPException(
                 status_code=404,
                 detail=f"Variable {key} not found"
@@ -453,73 +536,59 @@ def create_app(instance_id: str) -> FastAPI:
 
     @app.get("/api/v1/pools", response_model=PoolCollection)
     async def list_pools(
-        limit: Optional[int] = 100,
-        offset: Optional[int] = None,
+        limit: int = Query(100, ge=1),
+        offset: int = Query(0, ge=0),
         order_by: Optional[str] = None,
-        instance_id: str = "default"
-    ) -> PoolCollection:
+        cursor: Optional[str] = CURSOR_QUERY
+    ) -> Response:
         """List pools."""
-        store = get_store(instance_id)
-        pools = store.list_pools(limit=limit, offset=offset, order_by=order_by)
-        return PoolCollection(
-            pools=pools,
-            total_entries=len(store.list_pools())
-        )
+        def build() -> PoolCollection:
+            try:
+                pools, total = instance_store.list_pools(
+                    limit=limit, offset=offset, order_by=order_by, cursor=cursor
+                )
+            except PaginationError as exc:
+                raise HTTPException(status_code=400, detail=str(exc)) from None
+            keyset = cursor is not None or order_by == "name"
+            next_cursor = _next_cursor(pools, limit, "name") if keyset else None
+            return PoolCollection.model_construct(pools=pools, total_entries=total, next_cursor=next_cursor)
+        return cached_json("pools", (limit, offset, order_by, cursor), build)
 
     @app.get("/api/v1/pools/{pool_name}", response_model=Pool)
-    async def get_pool(
-        pool_name: str,
-        instance_id: str = "default"
-    ) -> Pool:
+    async def get_pool(pool_name: str) -> ModelJSONResponse:
         """Get a specific pool."""
-        store = get_store(instance_id)
-        pool = store.get_pool(pool_name)
-        if not pool:
-            raise HTTPException(status_code=404, detail=f"Pool {pool_name} not found")
-        return pool
+        pool = _require(instance_store.pools, pool_name, f"Pool {pool_name} not found")
+        return ModelJSONResponse(pool)
 
     @app.post("/api/v1/pools", response_model=Pool)
-    async def create_pool(
-        pool: Pool,
-        instance_id: str = "default"
-    ) -> Pool:
+    async def create_pool(pool: Pool) -> ModelJSONResponse:
         """Create a pool."""
-        store = get_store(instance_id)
-        # Check if pool already exists
-        if store.get_pool(pool.name):
+        if not instance_store.create_pool(pool):
             raise HTTPException(
                 status_code=409,
                 detail=f"Pool {pool.name} already exists"
             )
-        store.add_pool(pool)
-        return pool
+        return ModelJSONResponse(pool)
 
     @app.patch("/api/v1/pools/{pool_name}", response_model=Pool)
     async def update_pool(
         pool_name: str,
-        pool: Pool,
-        instance_id: str = "default"
-    ) -> Pool:
+        pool: Pool
+    ) -> ModelJSONResponse:
         """Update a pool."""
-        store = get_store(instance_id)
-        if not store.get_pool(pool_name):
+        # Ensure pool name matches URL parameter
+        pool.name = pool_name
+        if not instance_store.update_pool(pool):
             raise HTTPException(
                 status_code=404,
                 detail=f"Pool {pool_name} not found"
             )
-        # Ensure pool name matches URL parameter
-        pool.name = pool_name
-        store.add_pool(pool)
-        return pool
+        return ModelJSONResponse(pool)
 
     @app.delete("/api/v1/pools/{pool_name}", status_code=204)
-    async def delete_pool(
-        pool_name: str,
-        instance_id: str = "default"
-    ) -> None:
+    async def delete_pool(pool_name: str) -> None:
         """Delete a pool."""
-        store = get_store(instance_id)
-        if not store.delete_pool(pool_name):
+        if not instance_store.delete_pool(pool_name):
             raise HTTPException(
                 status_code=404,
                 detail=f"Pool {pool_name} not found"
@@ -530,115 +599,82 @@ def create_app(instance_id: str) -> FastAPI:
         pool_name: str,
         occupied_slots: Optional[int] = None,
         queued_slots: Optional[int] = None,
-        running_slots: Optional[int] = None,
-        instance_id: str = "default"
-    ) -> Pool:
+        running_slots: Optional[int] = None
+    ) -> ModelJSONResponse:
         """Update pool slot usage."""
-        store = get_store(instance_id)
-        pool = store.get_pool(pool_name)
+        # Only the provided slot counts are updated
+        pool = instance_store.update_pool_slots(pool_name, occupied_slots, queued_slots, running_slots)
         if not pool:
             raise HTTPException(
                 status_code=404,
                 detail=f"Pool {pool_name} not found"
             )
-        
-        # Update only provided slot counts
-        occupied = occupied_slots if occupied_slots is not None else pool.occupied_slots
-        queued = queued_slots if queued_slots is not None else pool.queued_slots
-        running = running_slots if running_slots is not None else pool.running_slots
-        
-        updated_pool = store.update_pool_slots(pool_name, occupied, queued, running)
-        if not updated_pool:
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to update pool {pool_name} slots"
-            )
-        return updated_pool
+        return ModelJSONResponse(pool)
 
     @app.get("/api/v1/providers", response_model=ProviderCollection)
     async def list_providers(
-        limit: Optional[int] = 100,
-        offset: Optional[int] = None,
+        limit: int = Query(100, ge=1),
+        offset: int = Query(0, ge=0),
         order_by: Optional[str] = None,
-        instance_id: str = "default"
-    ) -> ProviderCollection:
+        cursor: Optional[str] = CURSOR_QUERY
+    ) -> Response:
         """List providers."""
-        store = get_store(instance_id)
-        providers = store.list_providers(limit=limit, offset=offset, order_by=order_by)
-        return ProviderCollection(
-            providers=providers,
-            total_entries=len(store.list_providers())
-        )
+        def build() -> ProviderCollection:
+            try:
+                providers, total = instance_store.list_providers(
+                    limit=limit, offset=offset, order_by=order_by, cursor=cursor
+                )
+            except PaginationError as exc:
+                raise HTTPException(status_code=400, detail=str(exc)) from None
+            keyset = cursor is not None or order_by == "package_name"
+            next_cursor = _next_cursor(providers, limit, "package_name") if keyset else None
+            return ProviderCollection.model_construct(providers=providers, total_entries=total, next_cursor=next_cursor)
+        return cached_json("providers", (limit, offset, order_by, cursor), build)
 
     @app.get("/api/v1/providers/{provider_name}", response_model=Provider)
-    async def get_provider(
-        provider_name: str,
-        instance_id: str = "default"
-    ) -> Provider:
+    async def get_provider(provider_name: str) -> ModelJSONResponse:
         """Get a specific provider."""
-        store = get_store(instance_id)
-        provider = store.get_provider(provider_name)
-        if not provider:
-            raise HTTPException(status_code=404, detail=f"Provider {provider_name} not found")
-        return provider
+        provider = _require(instance_store.providers, provider_name, f"Provider {provider_name} not found")
+        return ModelJSONResponse(provider)
 
     @app.post("/api/v1/providers", response_model=Provider)
-    async def create_provider(
-        provider: Provider,
-        instance_id: str = "default"
-    ) -> Provider:
+    async def create_provider(provider: Provider) -> ModelJSONResponse:
         """Create a provider."""
-        store = get_store(instance_id)
-        # Check if provider already exists
-        if store.get_provider(provider.package_name):
+        if not instance_store.create_provider(provider):
             raise HTTPException(
                 status_code=409,
                 detail=f"Provider {provider.package_name} already exists"
             )
-        store.add_provider(provider)
-        return provider
+        return ModelJSONResponse(provider)
 
     @app.patch("/api/v1/providers/{provider_name}", response_model=Provider)
     async def update_provider(
         provider_name: str,
-        provider: Provider,
-        instance_id: str = "default"
-    ) -> Provider:
+        provider: Provider
+    ) -> ModelJSONResponse:
         """Update a provider."""
-        store = get_store(instance_id)
-        if not store.get_provider(provider_name):
+        # Ensure provider name matches URL parameter
+        provider.package_name = provider_name
+        if not instance_store.update_provider(provider):
             raise HTTPException(
                 status_code=404,
                 detail=f"Provider {provider_name} not found"
             )
-        # Ensure provider name matches URL parameter
-        provider.package_name = provider_name
-        store.add_provider(provider)
-        return provider
+        return ModelJSONResponse(provider)
 
     @app.delete("/api/v1/providers/{provider_name}", status_code=204)
-    async def delete_provider(
-        provider_name: str,
-        instance_id: str = "default"
-    ) -> None:
+    async def delete_provider(provider_name: str) -> None:
         """Delete a provider."""
-        store = get_store(instance_id)
-        if not store.delete_provider(provider_name):
+        if not instance_store.delete_provider(provider_name):
             raise HTTPException(
                 status_code=404,
                 detail=f"Provider {provider_name} not found"
             )
 
     @app.get("/api/v1/providers/{provider_name}/hooks", response_model=List[ProviderHook])
-    async def get_provider_hooks(
-        provider_name: str,
-        instance_id: str = "default"
-    ) -> List[ProviderHook]:
+    async def get_provider_hooks(provider_name: str) -> ModelJSONResponse:
         """Get hooks for a specific provider."""
-        store = get_store(instance_id)
-        provider = store.get_provider(provider_name)
-        if not provider:
-            raise HTTPException(status_code=404, detail=f"Provider {provider_name} not found")
-        return provider.hooks
+        provider = _require(instance_store.providers, provider_name, f"Provider {provider_name} not found")
+        return ModelJSONResponse(provider.hooks)
 
     return app
@@ -3,15 +3,16 @@ Data models for the Airflow mock API.
 """
 from datetime import datetime
 from typing import Dict, List, Optional, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, computed_field
 
 class DAG(BaseModel):
     dag_id: str
     is_paused: bool = False
     is_active: bool = True
+    # Later timestamps default to the first one, so construction reads the clock once
     last_parsed_time: datetime = Field(default_factory=datetime.utcnow)
-    last_pickled: datetime = Field(default_factory=datetime.utcnow)
-    last_expired: datetime = Field(default_factory=datetime.utcnow)
+    last_pickled: datetime = Field(default_factory=lambda data: data["last_parsed_time"])
+    last_expired: datetime = Field(default_factory=lambda data: data["last_parsed_time"])
     scheduler_lock: Optional[bool] = None
     pickle_id: Optional[str] = None
     fileloc: str = "/tmp/dag.py"
@@ -24,6 +25,7 @@ class DAGCollection(BaseModel):
     """Collection of DAGs with metadata."""
     dags: List[DAG]
     total_entries: int
+    next_cursor: Optional[str] = None
 
 class DAGRun(BaseModel):
     dag_id: str
@@ -100,6 +102,7 @@ class VariableCollection(BaseModel):
     """Collection of variables with metadata."""
     variables: List[Variable]
     total_entries: int
+    next_cursor: Optional[str] = None
 
 class Connection(BaseModel):
     conn_id: str
@@ -115,13 +118,14 @@ class ConnectionCollection(BaseModel):
     """Collection of connections with metadata."""
     connections: List[Connection]
     total_entries: int
+    next_cursor: Optional[str] = None
 
 class XCom(BaseModel):
     """XCom value for cross-task communication."""
     key: str
     value: Any
     timestamp: datetime = Field(default_factory=datetime.utcnow)
-    execution_date: datetime = Field(default_factory=datetime.utcnow)
+    execution_date: datetime = Field(default_factory=lambda data: data["timestamp"])
     task_id: str
     dag_id: str
     run_id: Optional[str] = None
@@ -140,17 +144,18 @@ class Pool(BaseModel):
     occupied_slots: int = 0
     queued_slots: int = 0
     running_slots: int = 0
-    open_slots: Optional[int] = None
-    
-    def __init__(self, **data):
-        super().__init__(**data)
-        # Calculate open slots based on total slots and occupied slots
-        self.open_slots = self.slots - self.occupied_slots
+
+    @computed_field
+    @property
+    def open_slots(self) -> int:
+        """Slots not currently occupied."""
+        return self.slots - self.occupied_slots
 
 class PoolCollection(BaseModel):
     """Collection of pools with metadata."""
     pools: List[Pool]
     total_entries: int
+    next_cursor: Optional[str] = None
 
 class ProviderHook(BaseModel):
     """Hook information for a provider."""
@@ -174,3 +179,4 @@ class ProviderCollection(BaseModel):
     """Collection of providers with metadata."""
     providers: List[Provider]
     total_entries: int
+    next_cursor: Optional[str] = None
@@ -2,19 +2,33 @@
 Sample data generator for Airflow mock API.
 """
 from datetime import datetime, timedelta
-from typing import List
+from typing import Dict, List, Optional
 import random
 from .models import DAG, DAGRun, TaskInstance, Variable, Connection
 from .store import InstanceStore
 
+# Fixed offsets used by the generators, built once instead of per object
+_DAY = timedelta(days=1)
+_TASK_STAGGER = timedelta(minutes=5)
+_DAG_RUN_LENGTH = timedelta(minutes=30)
+_TASK_RUN_LENGTHS = tuple(timedelta(minutes=m) for m in range(1, 11))
+
+# States drawn by the generators; every generated object shares these strings
+_RUNNING = "running"
+_DAG_RUN_STATES = ("success", "failed", _RUNNING)
+_TASK_STATES = ("success", "failed", _RUNNING, "upstream_failed")
+
 def generate_sample_dags(count: int = 5) -> List[DAG]:
     """Generate sample DAGs."""
     dags = []
-    for i in range(count):
+    now = datetime.utcnow()
+    paused = random.choices([True, False], k=count)
+    for i, is_paused in enumerate(paused):
         dag_id = f"example_dag_{i}"
         dag = DAG(
             dag_id=dag_id,
-            is_paused=random.choice([True, False]),
+            last_parsed_time=now,
+            is_paused=is_paused,
             is_active=True,
             fileloc=f"/tmp/dags/{dag_id}.py",
             owners=["admin"],
@@ -28,51 +42,55 @@ def generate_sample_dags(count: int = 5) -> List[DAG]:
 def generate_sample_dag_runs(dag_id: str, count: int = 3) -> List[DAGRun]:
     """Generate sample DAG runs for a DAG."""
     dag_runs = []
-    base_date = datetime.utcnow() - timedelta(days=count)
+    execution_date = datetime.utcnow() - count * _DAY
+    states = random.choices(_DAG_RUN_STATES, k=count)
     
-    for i in range(count):
-        execution_date = base_date + timedelta(days=i)
-        run_id = f"scheduled__{execution_date.strftime('%Y-%m-%dT%H:%M:%S')}"
-        state = random.choice(["success", "failed", "running"])
+    for state in states:
+        run_id = f"scheduled__{execution_date.isoformat(timespec='seconds')}"
         
         dag_run = DAGRun(
             dag_id=dag_id,
             run_id=run_id,
             execution_date=execution_date,
             start_date=execution_date,
-            end_date=execution_date + timedelta(minutes=30) if state != "running" else None,
+            end_date=execution_date + _DAG_RUN_LENGTH if state != _RUNNING else None,
             state=state,
             external_trigger=False,
             conf={}
         )
         dag_runs.append(dag_run)
+        execution_date += _DAY
     return dag_runs
 
 def generate_sample_task_instances(dag_id: str, run_id: str, count: int = 4) -> List[TaskInstance]:
     """Generate sample task instances for a DAG run."""
     task_instances = []
-    base_date = datetime.utcnow() - timedelta(hours=1)
+    start_date = datetime.utcnow() - timedelta(hours=1)
+    # Draw all random fields up front, one call per field instead of per task
+    states = random.choices(_TASK_STATES, k=count)
+    try_numbers = random.choices(range(1, 4), k=count)
+    run_lengths = random.choices(_TASK_RUN_LENGTHS, k=count)
+    durations = random.choices(range(60, 601), k=count)
     
-    for i in range(count):
+    for i, (state, try_number, run_length, duration) in enumerate(zip(states, try_numbers, run_lengths, durations)):
         task_id = f"task_{i}"
-        state = random.choice(["success", "failed", "running", "upstream_failed"])
-        start_date = base_date + timedelta(minutes=i*5)
         
         task_instance = TaskInstance(
             task_id=task_id,
             dag_id=dag_id,
             run_id=run_id,
             state=state,
-            try_number=random.randint(1, 3),
+            try_number=try_number,
             max_tries=3,
             start_date=start_date,
-            end_date=start_date + timedelta(minutes=random.randint(1, 10)) if state != "running" else None,
-            duration=random.randint(60, 600) if state != "running" else None,
+            end_date=start_date + run_length if state != _RUNNING else None,
+            duration=duration if state != _RUNNING else None,
             pool="default_pool",
             queue="default",
             priority_weight=1
         )
         task_instances.append(task_instance)
+        start_date += _TASK_STAGGER
     return task_instances
 
 def generate_sample_variables() -> List[Variable]:
@@ -110,27 +128,50 @@ def generate_sample_connections() -> List[Connection]:
         )
     ]
 
+# Canonical sample dataset, generated on first use and copied into each instance
+_template: Optional[Dict[str, list]] = None
+
+def _sample_template() -> Dict[str, list]:
+    """Get the canonical sample dataset, generating it on first use."""
+    global _template
+    if _template is None:
+        # Generate DAGs, their runs and the task instances of each run
+        dags = generate_sample_dags()
+        dag_runs = []
+        task_instances = []
+        for dag in dags:
+            runs = generate_sample_dag_runs(dag.dag_id)
+            dag_runs.extend(runs)
+            for dag_run in runs:
+                task_instances.extend(generate_sample_task_instances(dag.dag_id, dag_run.run_id))
+        _template = {
+            "dags": dags,
+            "dag_runs": dag_runs,
+            "task_instances": task_instances,
+            "variables": generate_sample_variables(),
+            "connections": generate_sample_connections(),
+        }
+    return _template
+
 def populate_instance(instance: InstanceStore) -> None:
-    """Populate an instance with sample data."""
-    # Generate and add DAGs
-    dags = generate_sample_dags()
-    for dag in dags:
-        instance.add_dag(dag)
-        
-        # Generate and add DAG runs for each DAG
-        dag_runs = generate_sample_dag_runs(dag.dag_id)
-        for dag_run in dag_runs:
-            instance.add_dag_run(dag_run)
-            
-            # Generate and add task instances for each DAG run
-            task_instances = generate_sample_task_instances(dag.dag_id, dag_run.run_id)
-            for task_instance in task_instances:
-                instance.add_task_instance(task_instance)
+    """Populate an instance with sample data.
+
+    DAGs, runs and task instances are copied per instance, since the API
+    mutates them in place. Variables and connections are only ever replaced
+    wholesale, so every instance shares the template's objects; code that
+    changes one must store a new object rather than edit the shared one.
+    """
+    template = _sample_template()
+
+    # Add DAGs, runs and task instances in bulk, grouped by DAG and by run
+    instance.bulk_add_dags([dag.model_copy(deep=True) for dag in template["dags"]])
+    instance.bulk_add_dag_runs([dag_run.model_copy(deep=True) for dag_run in template["dag_runs"]])
+    instance.bulk_add_task_instances([ti.model_copy(deep=True) for ti in template["task_instances"]])
     
     # Add variables
-    for variable in generate_sample_variables():
-        instance.variables[variable.key] = variable
+    for variable in template["variables"]:
+        instance.add_variable(variable)
     
     # Add connections
-    for connection in generate_sample_connections():
-        instance.connections[connection.conn_id] = connection
+    for connection in template["connections"]:
+        instance.add_connection(connection)
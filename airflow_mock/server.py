@@ -5,25 +5,33 @@ import asyncio
 import uvicorn
 from typing import Dict, List
 from .api import create_app
-from .store import store
-from .sample_data import populate_instance
 
 class MockServer:
     """Server that manages multiple Airflow mock instances."""
+
+    __slots__ = ("servers",)
     
     def __init__(self):
         self.servers: Dict[str, uvicorn.Server] = {}
         
     async def start_instance(self, instance_id: str, port: int, populate: bool = False) -> None:
         """Start a new Airflow mock instance."""
-        app = create_app(instance_id)
-        
-        # Populate with sample data if requested
-        if populate:
-            instance = store.get_instance(instance_id)
-            populate_instance(instance)
+        # Sample data, if requested, is loaded by the app's startup hook
+        app = create_app(instance_id, populate=populate)
         
-        config = uvicorn.Config(app, host="0.0.0.0", port=port)
+        # The event loop (uvloop where available) is chosen by the caller, since
+        # serve() runs on the current loop; pin the C HTTP parser here. Access
+        # logging writes synchronously per request, so it is left off.
+        config = uvicorn.Config(
+            app,
+            host="0.0.0.0",
+            port=port,
+            http="httptools",
+            access_log=False,
+            backlog=2048,
+            limit_concurrency=1000,
+            timeout_keep_alive=5,
+        )
         server = uvicorn.Server(config)
         self.servers[instance_id] = server
         await server.serve()
@@ -1,76 +1,366 @@
 """
 Data store for managing multiple Airflow instance states.
 """
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+from itertools import groupby, islice
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Any, Set, Tuple
+from datetime import datetime, timezone
+from sortedcontainers import SortedKeyList, SortedList
 from .models import (
     DAG, DAGRun, TaskInstance, Variable,
     Connection, TaskLog, XCom, Pool,
     Provider, ProviderHook
 )
 
+# Shared read-only default for lookups that miss, so reads never allocate a dict
+_EMPTY: Mapping = MappingProxyType({})
+
+def _utc_naive(value: datetime) -> datetime:
+    """Normalize a datetime for comparison; naive values are taken to be UTC already."""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+def _execution_date_key(dag_run: DAGRun) -> datetime:
+    """Sort key for DAG runs, so naive and timezone-aware execution dates can be mixed."""
+    return _utc_naive(dag_run.execution_date)
+
+def _ordinal_key(ordinals: Dict[str, int]) -> Callable[[TaskInstance], int]:
+    """Sort key placing a run's task instances in the order they were first added."""
+    return lambda task_instance: ordinals[task_instance.task_id]
+
+def _xcom_timestamp_key(xcom: XCom) -> datetime:
+    """Comparison key for XCom recency, so naive and timezone-aware timestamps can be mixed."""
+    return _utc_naive(xcom.timestamp)
+
+class PaginationError(ValueError):
+    """Raised for a page request whose parameters can't be combined."""
+
 class InstanceStore:
-    """Manages the state for a single Airflow instance."""
+    """Manages the state for a single Airflow instance.
+
+    Not thread-safe: it is only touched from one thread at a time (the startup
+    populate worker, then the instance's event loop), and no method yields
+    control, so each call is atomic between requests.
+    """
+
+    # Natural key attribute of each keyed collection, used for cursor pagination
+    _KEY_ATTRS = {
+        "dags": "dag_id",
+        "variables": "key",
+        "connections": "conn_id",
+        "pools": "name",
+        "providers": "package_name",
+    }
+
+    __slots__ = (
+        "instance_id",
+        "dags",
+        "dag_runs", "_dag_runs_by_date", "_dag_run_states",
+        "task_instances", "_ti_by_run", "_ti_ordinals", "_ti_states", "_ti_state_index",
+        "task_logs",
+        "variables",
+        "connections",
+        "xcoms", "_xcom_keys", "_xcom_runs", "_xcom_latest",
+        "pools",
+        "providers",
+        "_key_indexes", "_sorted_indexes", "_versions",
+    )
     
     def __init__(self, instance_id: str):
         self.instance_id = instance_id
         self.dags: Dict[str, DAG] = {}
         self.dag_runs: Dict[str, Dict[str, DAGRun]] = {}  # dag_id -> run_id -> DAGRun
-        self.task_instances: Dict[str, Dict[str, Dict[str, TaskInstance]]] = {}  # dag_id -> run_id -> task_id -> TaskInstance
-        self.task_logs: Dict[str, Dict[str, Dict[str, Dict[int, TaskLog]]]] = {}  # dag_id -> run_id -> task_id -> try_number -> TaskLog
+        self._dag_runs_by_date: Dict[str, SortedKeyList] = {}  # dag_id -> DAGRuns ordered by execution_date
+        self._dag_run_states: Dict[str, Dict[str, Set[str]]] = {}  # dag_id -> state -> run_ids
+        self.task_instances: Dict[Tuple[str, str, str], TaskInstance] = {}  # (dag_id, run_id, task_id) -> TaskInstance
+        self._ti_by_run: Dict[Tuple[str, str], Dict[str, TaskInstance]] = {}  # (dag_id, run_id) -> task_id -> TaskInstance, in insertion order
+        self._ti_ordinals: Dict[Tuple[str, str], Dict[str, int]] = {}  # (dag_id, run_id) -> task_id -> position in the run
+        self._ti_states: Dict[Tuple[str, str], Dict[str, str]] = {}  # (dag_id, run_id) -> task_id -> state it is indexed under
+        self._ti_state_index: Dict[Tuple[str, str], Dict[str, SortedKeyList]] = {}  # (dag_id, run_id) -> state -> TaskInstances in run order
+        self.task_logs: Dict[Tuple[str, str, str, int], TaskLog] = {}  # (dag_id, run_id, task_id, try_number) -> TaskLog
         self.variables: Dict[str, Variable] = {}
         self.connections: Dict[str, Connection] = {}
-        self.xcoms: Dict[str, Dict[str, Dict[str, Dict[str, XCom]]]] = {}  # dag_id -> task_id -> key -> run_id -> XCom
+        self.xcoms: Dict[Tuple[str, str, str, str], XCom] = {}  # (dag_id, task_id, key, run_id) -> XCom
+        self._xcom_keys: Dict[Tuple[str, str], Dict[str, None]] = {}  # (dag_id, task_id) -> keys in insertion order
+        self._xcom_runs: Dict[Tuple[str, str, str], Dict[str, None]] = {}  # (dag_id, task_id, key) -> run_ids in insertion order
+        self._xcom_latest: Dict[Tuple[str, str, str], XCom] = {}  # (dag_id, task_id, key) -> XCom with the newest timestamp
         self.pools: Dict[str, Pool] = {}
         self.providers: Dict[str, Provider] = {}  # package_name -> Provider
+        self._key_indexes: Dict[str, SortedList] = {collection: SortedList() for collection in self._KEY_ATTRS}  # collection -> keys in sorted order
+        self._sorted_indexes: Dict[str, Dict[str, List[str]]] = {}  # collection -> order_by -> keys in that order
+        self._versions: Dict[str, int] = {}  # collection -> number of mutations so far
+
+    def _touch(self, collection: str) -> None:
+        """Record a change to a collection: bump its version and drop its cached orderings."""
+        self._versions[collection] = self._versions.get(collection, 0) + 1
+        self._sorted_indexes.pop(collection, None)
+
+    def version(self, collection: str) -> int:
+        """Get a counter that changes whenever the named collection is mutated."""
+        return self._versions.get(collection, 0)
+
+    def _index_key(self, collection: str, key: str) -> None:
+        """Insert a new key into the sorted key index of a collection."""
+        self._key_indexes[collection].add(key)
+
+    def _unindex_key(self, collection: str, key: str) -> None:
+        """Remove a deleted key from the sorted key index of a collection."""
+        self._key_indexes[collection].remove(key)
+
+    def _sorted_keys(self, collection: str, items: Dict[str, Any], order_by: str) -> List[str]:
+        """Get the keys of a collection sorted by an order_by attribute, sorting only on a cache miss.
+
+        Each direction is sorted and cached on its own, so items with equal
+        values keep their insertion order in descending pages as well.
+        """
+        orderings = self._sorted_indexes.setdefault(collection, {})
+        keys = orderings.get(order_by)
+        if keys is None:
+            reverse = order_by.startswith('-')
+            attr = order_by[1:] if reverse else order_by
+            ordered = sorted(items.values(), key=attrgetter(attr), reverse=reverse)
+            keys = list(map(attrgetter(self._KEY_ATTRS[collection]), ordered))
+            orderings[order_by] = keys
+        return keys
+
+    def _list_page(
+        self,
+        collection: str,
+        items: Dict[str, Any],
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        order_by: Optional[str] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Any], int]:
+        """Get one page of a keyed collection along with the collection size.
+
+        A cursor selects keyset pagination: the page starts after the given key
+        and follows the natural key order, which is located with a bisection
+        instead of skipping over earlier items. Combining a cursor with any
+        other ordering raises PaginationError.
+        """
+        start = offset or 0
+        key_attr = self._KEY_ATTRS[collection]
+        reverse = bool(order_by) and order_by.startswith('-')
+        attr = order_by[1:] if reverse else order_by
+        if cursor is not None:
+            if attr not in (None, key_attr) or reverse:
+                raise PaginationError(f"Cursor pagination requires ordering by {key_attr}")
+            keys = self._key_indexes[collection]
+            start += keys.bisect_right(cursor)
+        elif attr == key_attr:
+            keys = self._key_indexes[collection]
+        elif attr:
+            keys = self._sorted_keys(collection, items, order_by)
+            reverse = False
+        else:
+            # Copy only the requested window out of the insertion-ordered dict
+            stop = start + limit if limit is not None else None
+            return list(islice(items.values(), start, stop)), len(items)
+
+        if reverse:
+            # Keys are unique, so descending pages can be read backwards off the ascending index
+            end = max(len(keys) - start, 0)
+            begin = max(end - limit, 0) if limit is not None else 0
+            return [items[key] for key in reversed(keys[begin:end])], len(items)
+        stop = start + limit if limit is not None else None
+        return [items[key] for key in keys[start:stop]], len(items)
 
     def add_dag(self, dag: DAG) -> None:
         """Add or update a DAG."""
+        if dag.dag_id not in self.dags:
+            self._index_key("dags", dag.dag_id)
         self.dags[dag.dag_id] = dag
+        self._touch("dags")
+
+    def bulk_add_dags(self, dags: List[DAG]) -> None:
+        """Add or update many DAGs, recording a single change to the collection."""
+        self._key_indexes["dags"].update({dag.dag_id for dag in dags} - self.dags.keys())
+        self.dags.update((dag.dag_id, dag) for dag in dags)
+        self._touch("dags")
         
     def get_dag(self, dag_id: str) -> Optional[DAG]:
         """Get a DAG by ID."""
         return self.dags.get(dag_id)
+
+    def list_dags(self, limit: int, offset: int = 0, cursor: Optional[str] = None) -> Tuple[List[DAG], int]:
+        """List DAGs ordered by dag_id, optionally starting after the dag_id given as cursor."""
+        return self._list_page("dags", self.dags, limit, offset, order_by="dag_id", cursor=cursor)
         
     def add_dag_run(self, dag_run: DAGRun) -> None:
         """Add or update a DAG run."""
         if dag_run.dag_id not in self.dag_runs:
             self.dag_runs[dag_run.dag_id] = {}
+            self._dag_runs_by_date[dag_run.dag_id] = SortedKeyList(key=_execution_date_key)
+            self._dag_run_states[dag_run.dag_id] = {}
+        runs_by_date = self._dag_runs_by_date[dag_run.dag_id]
+        run_states = self._dag_run_states[dag_run.dag_id]
+
+        # Update the indexes before the run itself, so a failure can't leave it half-indexed
+        previous = self.dag_runs[dag_run.dag_id].get(dag_run.run_id)
+        if previous is not None:
+            runs_by_date.remove(previous)
+            previous_bucket = run_states[previous.state]
+            previous_bucket.discard(previous.run_id)
+            if not previous_bucket:
+                del run_states[previous.state]
+        runs_by_date.add(dag_run)
+        run_states.setdefault(dag_run.state, set()).add(dag_run.run_id)
+
         self.dag_runs[dag_run.dag_id][dag_run.run_id] = dag_run
+
+    def bulk_add_dag_runs(self, dag_runs: List[DAGRun]) -> None:
+        """Add many DAG runs, building the indexes of each DAG in one pass.
+
+        Consecutive runs of a DAG that has no runs yet are indexed together;
+        anything that replaces an existing run goes through add_dag_run.
+        """
+        for dag_id, group in groupby(dag_runs, key=attrgetter("dag_id")):
+            group = list(group)
+            if self.dag_runs.get(dag_id) or len({dr.run_id for dr in group}) < len(group):
+                for dag_run in group:
+                    self.add_dag_run(dag_run)
+                continue
+            self.dag_runs[dag_id] = {dr.run_id: dr for dr in group}
+            self._dag_runs_by_date[dag_id] = SortedKeyList(group, key=_execution_date_key)
+            run_states = self._dag_run_states[dag_id] = {}
+            for dag_run in group:
+                run_states.setdefault(dag_run.state, set()).add(dag_run.run_id)
         
     def get_dag_run(self, dag_id: str, run_id: str) -> Optional[DAGRun]:
         """Get a DAG run by DAG ID and run ID."""
-        return self.dag_runs.get(dag_id, {}).get(run_id)
+        return self.dag_runs.get(dag_id, _EMPTY).get(run_id)
+
+    def list_dag_runs(
+        self,
+        dag_id: str,
+        limit: int,
+        offset: int = 0,
+        execution_date_gte: Optional[datetime] = None,
+        execution_date_lte: Optional[datetime] = None,
+        state: Optional[str] = None,
+    ) -> Tuple[List[DAGRun], int]:
+        """List DAG runs ordered by execution date. Returns the page and the total match count."""
+        runs_by_date = self._dag_runs_by_date.get(dag_id)
+        if not runs_by_date:
+            return [], 0
+        if execution_date_gte:
+            execution_date_gte = _utc_naive(execution_date_gte)
+        if execution_date_lte:
+            execution_date_lte = _utc_naive(execution_date_lte)
+
+        # Narrow to the execution date range with two O(log n) bisections
+        lo = runs_by_date.bisect_key_left(execution_date_gte) if execution_date_gte else 0
+        hi = runs_by_date.bisect_key_right(execution_date_lte) if execution_date_lte else len(runs_by_date)
+        if not state:
+            page = list(runs_by_date.islice(lo + offset, min(hi, lo + offset + limit)))
+            return page, max(hi - lo, 0)
+
+        run_ids = self._dag_run_states[dag_id].get(state, set())
+        if len(run_ids) <= hi - lo:
+            # Few runs in this state: stop scanning the range once the page is full
+            # and count matches from the state bucket instead
+            matches = (dr for dr in runs_by_date.islice(lo, hi) if dr.run_id in run_ids)
+            page = list(islice(matches, offset, offset + limit))
+            runs = self.dag_runs[dag_id]
+            total = sum(
+                1 for run_id in run_ids
+                if (not execution_date_gte or _execution_date_key(runs[run_id]) >= execution_date_gte)
+                and (not execution_date_lte or _execution_date_key(runs[run_id]) <= execution_date_lte)
+            )
+            return page, total
+
+        # Narrow date range: collect the page and count matches in a single pass
+        page = []
+        total = 0
+        for dr in runs_by_date.islice(lo, hi):
+            if dr.run_id in run_ids:
+                if offset <= total < offset + limit:
+                    page.append(dr)
+                total += 1
+        return page, total
         
     def add_task_instance(self, task_instance: TaskInstance) -> None:
         """Add or update a task instance."""
-        if task_instance.dag_id not in self.task_instances:
-            self.task_instances[task_instance.dag_id] = {}
-        if task_instance.run_id not in self.task_instances[task_instance.dag_id]:
-            self.task_instances[task_instance.dag_id][task_instance.run_id] = {}
-        self.task_instances[task_instance.dag_id][task_instance.run_id][task_instance.task_id] = task_instance
+        run_key = (task_instance.dag_id, task_instance.run_id)
+        self.task_instances[(task_instance.dag_id, task_instance.run_id, task_instance.task_id)] = task_instance
+        self._ti_by_run.setdefault(run_key, {})[task_instance.task_id] = task_instance
+        ordinals = self._ti_ordinals.setdefault(run_key, {})
+        ordinal = ordinals.setdefault(task_instance.task_id, len(ordinals))
+
+        # Move the task instance into the bucket for its current state. It may
+        # have been mutated in place, so its old bucket is looked up by task_id.
+        states = self._ti_states.setdefault(run_key, {})
+        state_index = self._ti_state_index.setdefault(run_key, {})
+        old_state = states.get(task_instance.task_id)
+        if old_state is not None:
+            bucket = state_index[old_state]
+            del bucket[bucket.bisect_key_left(ordinal)]
+            if not bucket:
+                del state_index[old_state]
+        states[task_instance.task_id] = task_instance.state
+        bucket = state_index.get(task_instance.state)
+        if bucket is None:
+            bucket = state_index[task_instance.state] = SortedKeyList(key=_ordinal_key(ordinals))
+        bucket.add(task_instance)
+
+    def bulk_add_task_instances(self, task_instances: List[TaskInstance]) -> None:
+        """Add many task instances, building the indexes of each DAG run in one pass.
+
+        Consecutive task instances of a run that has none yet are indexed
+        together; anything that replaces an existing one goes through
+        add_task_instance.
+        """
+        for run_key, group in groupby(task_instances, key=attrgetter("dag_id", "run_id")):
+            group = list(group)
+            if run_key in self._ti_by_run or len({ti.task_id for ti in group}) < len(group):
+                for task_instance in group:
+                    self.add_task_instance(task_instance)
+                continue
+            dag_id, run_id = run_key
+            self.task_instances.update(((dag_id, run_id, ti.task_id), ti) for ti in group)
+            self._ti_by_run[run_key] = {ti.task_id: ti for ti in group}
+            ordinals = self._ti_ordinals[run_key] = {ti.task_id: i for i, ti in enumerate(group)}
+            self._ti_states[run_key] = {ti.task_id: ti.state for ti in group}
+            by_state: Dict[str, List[TaskInstance]] = {}
+            for task_instance in group:
+                by_state.setdefault(task_instance.state, []).append(task_instance)
+            self._ti_state_index[run_key] = {
+                state: SortedKeyList(bucket, key=_ordinal_key(ordinals)) for state, bucket in by_state.items()
+            }
         
     def get_task_instance(self, dag_id: str, run_id: str, task_id: str) -> Optional[TaskInstance]:
         """Get a task instance by DAG ID, run ID, and task ID."""
-        return self.task_instances.get(dag_id, {}).get(run_id, {}).get(task_id)
+        return self.task_instances.get((dag_id, run_id, task_id))
 
     def get_task_instances(self, dag_id: str, run_id: str) -> List[TaskInstance]:
         """Get all task instances for a DAG run."""
-        return list(self.task_instances.get(dag_id, {}).get(run_id, {}).values())
+        return list(self._ti_by_run.get((dag_id, run_id), _EMPTY).values())
+
+    def list_task_instances(
+        self,
+        dag_id: str,
+        run_id: str,
+        limit: int,
+        offset: int = 0,
+        state: Optional[str] = None,
+    ) -> Tuple[List[TaskInstance], int]:
+        """List task instances for a DAG run. Returns the page and the total match count."""
+        if state:
+            bucket = self._ti_state_index.get((dag_id, run_id), _EMPTY).get(state, ())
+            return list(bucket[offset:offset + limit]), len(bucket)
+        task_instances = self._ti_by_run.get((dag_id, run_id), _EMPTY)
+        return list(islice(task_instances.values(), offset, offset + limit)), len(task_instances)
 
     def add_task_log(self, dag_id: str, run_id: str, task_id: str, try_number: int, log: TaskLog) -> None:
         """Add a log entry for a task instance."""
-        if dag_id not in self.task_logs:
-            self.task_logs[dag_id] = {}
-        if run_id not in self.task_logs[dag_id]:
-            self.task_logs[dag_id][run_id] = {}
-        if task_id not in self.task_logs[dag_id][run_id]:
-            self.task_logs[dag_id][run_id][task_id] = {}
-        self.task_logs[dag_id][run_id][task_id][try_number] = log
+        self.task_logs[(dag_id, run_id, task_id, try_number)] = log
 
     def get_task_log(self, dag_id: str, run_id: str, task_id: str, try_number: int) -> Optional[TaskLog]:
         """Get a log entry for a task instance."""
-        return self.task_logs.get(dag_id, {}).get(run_id, {}).get(task_id, {}).get(try_number)
+        return self.task_logs.get((dag_id, run_id, task_id, try_number))
 
     def clear_task_instance(self, task_instance: TaskInstance) -> None:
         """Clear a task instance by resetting its state and try number."""
@@ -82,25 +372,42 @@ class InstanceStore:
         self.add_task_instance(task_instance)
 
     def add_xcom_value(self, xcom: XCom) -> None:
-        """Add or update an XCom value."""
-        if xcom.dag_id not in self.xcoms:
-            self.xcoms[xcom.dag_id] = {}
-        if xcom.task_id not in self.xcoms[xcom.dag_id]:
-            self.xcoms[xcom.dag_id][xcom.task_id] = {}
-        if xcom.key not in self.xcoms[xcom.dag_id][xcom.task_id]:
-            self.xcoms[xcom.dag_id][xcom.task_id][xcom.key] = {}
-        if xcom.run_id:
-            self.xcoms[xcom.dag_id][xcom.task_id][xcom.key][xcom.run_id] = xcom
+        """Add or update an XCom value. Values without a run ID are not stored."""
+        if not xcom.run_id:
+            return
+        key3 = (xcom.dag_id, xcom.task_id, xcom.key)
+
+        # Update the latest index before the value itself, so a failure can't leave it stale
+        latest = self._xcom_latest.get(key3)
+        stale_latest = False
+        if latest is None or _xcom_timestamp_key(xcom) > _xcom_timestamp_key(latest):
+            self._xcom_latest[key3] = xcom
+        else:
+            # Overwriting the latest value with an older one needs a rescan once stored
+            stale_latest = latest.run_id == xcom.run_id
+
+        self.xcoms[(xcom.dag_id, xcom.task_id, xcom.key, xcom.run_id)] = xcom
+        self._xcom_keys.setdefault((xcom.dag_id, xcom.task_id), {})[xcom.key] = None
+        self._xcom_runs.setdefault(key3, {})[xcom.run_id] = None
+        if stale_latest:
+            self._refresh_xcom_latest(key3)
+        self._touch("xcoms")
+
+    def _refresh_xcom_latest(self, key3: Tuple[str, str, str]) -> None:
+        """Recompute the newest XCom of a key from its remaining runs."""
+        dag_id, task_id, key = key3
+        run_ids = self._xcom_runs.get(key3)
+        if not run_ids:
+            self._xcom_latest.pop(key3, None)
+            return
+        self._xcom_latest[key3] = max((self.xcoms[(dag_id, task_id, key, r_id)] for r_id in run_ids), key=_xcom_timestamp_key)
 
     def get_xcom_value(self, dag_id: str, task_id: str, key: str, run_id: Optional[str] = None) -> Optional[XCom]:
         """Get an XCom value."""
         if run_id:
-            return self.xcoms.get(dag_id, {}).get(task_id, {}).get(key, {}).get(run_id)
+            return self.xcoms.get((dag_id, task_id, key, run_id))
         # If run_id is not specified, return the most recent XCom value
-        xcoms = self.xcoms.get(dag_id, {}).get(task_id, {}).get(key, {}).values()
-        if not xcoms:
-            return None
-        return max(xcoms, key=lambda x: x.timestamp)
+        return self._xcom_latest.get((dag_id, task_id, key))
 
     def list_xcom_values(
         self,
@@ -110,52 +417,80 @@ class InstanceStore:
         key: Optional[str] = None
     ) -> List[XCom]:
         """List XCom values with optional filtering."""
-        result = []
-        
-        # Get all XComs if no DAG ID specified
-        dag_ids = [dag_id] if dag_id else list(self.xcoms.keys())
-        
-        for d_id in dag_ids:
-            if d_id not in self.xcoms:
-                continue
-                
-            # Get all tasks if no task ID specified
-            task_ids = [task_id] if task_id else list(self.xcoms[d_id].keys())
-            
-            for t_id in task_ids:
-                if t_id not in self.xcoms[d_id]:
-                    continue
-                    
-                # Get all keys if no key specified
-                keys = [key] if key else list(self.xcoms[d_id][t_id].keys())
-                
-                for k in keys:
-                    if k not in self.xcoms[d_id][t_id]:
-                        continue
-                        
-                    # Get all run IDs if no run ID specified
-                    run_ids = [run_id] if run_id else list(self.xcoms[d_id][t_id][k].keys())
-                    
-                    for r_id in run_ids:
-                        if r_id in self.xcoms[d_id][t_id][k]:
-                            result.append(self.xcoms[d_id][t_id][k][r_id])
-                            
-        return result
+        if dag_id and task_id:
+            # Task-scoped: walk that task's keys and their runs through the indexes
+            if key:
+                keys = [key]
+            else:
+                keys = self._xcom_keys.get((dag_id, task_id), _EMPTY)
+            result = []
+            for k in keys:
+                run_ids = self._xcom_runs.get((dag_id, task_id, k), _EMPTY)
+                if run_id:
+                    run_ids = [run_id] if run_id in run_ids else []
+                result.extend(self.xcoms[(dag_id, task_id, k, r_id)] for r_id in run_ids)
+            return result
+
+        return [
+            xcom for (d_id, t_id, k, r_id), xcom in self.xcoms.items()
+            if (not dag_id or d_id == dag_id)
+            and (not task_id or t_id == task_id)
+            and (not key or k == key)
+            and (not run_id or r_id == run_id)
+        ]
 
     def delete_xcom_value(self, dag_id: str, task_id: str, key: str, run_id: Optional[str] = None) -> bool:
         """Delete an XCom value. Returns True if deleted, False if not found."""
-        try:
-            if run_id:
-                del self.xcoms[dag_id][task_id][key][run_id]
-            else:
-                del self.xcoms[dag_id][task_id][key]
-            return True
-        except KeyError:
+        key3 = (dag_id, task_id, key)
+        run_ids = self._xcom_runs.get(key3)
+        if run_ids is None:
             return False
+        if run_id:
+            if run_id not in run_ids:
+                return False
+            del run_ids[run_id]
+            del self.xcoms[(dag_id, task_id, key, run_id)]
+            if not run_ids:
+                del self._xcom_runs[key3]
+                self._unindex_xcom_key(dag_id, task_id, key)
+            if self._xcom_latest[key3].run_id == run_id:
+                self._refresh_xcom_latest(key3)
+        else:
+            for r_id in self._xcom_runs.pop(key3):
+                del self.xcoms[(dag_id, task_id, key, r_id)]
+            del self._xcom_latest[key3]
+            self._unindex_xcom_key(dag_id, task_id, key)
+        self._touch("xcoms")
+        return True
+
+    def _unindex_xcom_key(self, dag_id: str, task_id: str, key: str) -> None:
+        """Drop a key with no runs left from its task's key index."""
+        keys = self._xcom_keys[(dag_id, task_id)]
+        del keys[key]
+        if not keys:
+            del self._xcom_keys[(dag_id, task_id)]
 
     def add_pool(self, pool: Pool) -> None:
         """Add or update a pool."""
+        if pool.name not in self.pools:
+            self._index_key("pools", pool.name)
         self.pools[pool.name] = pool
+        self._touch("pools")
+
+    def create_pool(self, pool: Pool) -> bool:
+        """Add a new pool. Returns True if added, False if one already exists."""
+        if self.pools.setdefault(pool.name, pool) is not pool:
+            return False
+        self._index_key("pools", pool.name)
+        self._touch("pools")
+        return True
+
+    def update_pool(self, pool: Pool) -> bool:
+        """Replace an existing pool. Returns True if updated, False if not found."""
+        if pool.name not in self.pools:
+            return False
+        self.add_pool(pool)
+        return True
 
     def get_pool(self, name: str) -> Optional[Pool]:
         """Get a pool by name."""
@@ -166,46 +501,62 @@ class InstanceStore:
         limit: Optional[int] = None,
         offset: Optional[int] = None,
         order_by: Optional[str] = None,
-    ) -> List[Pool]:
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Pool], int]:
         """List pools with optional pagination and ordering."""
-        pools = list(self.pools.values())
-        
-        # Apply ordering if specified
-        if order_by:
-            reverse = order_by.startswith('-')
-            key = order_by[1:] if reverse else order_by
-            pools.sort(key=lambda x: getattr(x, key), reverse=reverse)
-            
-        # Apply pagination
-        if offset is not None:
-            pools = pools[offset:]
-        if limit is not None:
-            pools = pools[:limit]
-            
-        return pools
+        return self._list_page("pools", self.pools, limit, offset, order_by, cursor)
 
     def delete_pool(self, name: str) -> bool:
         """Delete a pool. Returns True if deleted, False if not found."""
         try:
             del self.pools[name]
+            self._unindex_key("pools", name)
+            self._touch("pools")
             return True
         except KeyError:
             return False
 
-    def update_pool_slots(self, name: str, occupied: int = 0, queued: int = 0, running: int = 0) -> Optional[Pool]:
-        """Update pool slot usage."""
+    def update_pool_slots(
+        self,
+        name: str,
+        occupied: Optional[int] = None,
+        queued: Optional[int] = None,
+        running: Optional[int] = None,
+    ) -> Optional[Pool]:
+        """Update pool slot usage. Counts left as None keep their current value."""
         pool = self.get_pool(name)
         if pool:
-            pool.occupied_slots = occupied
-            pool.queued_slots = queued
-            pool.running_slots = running
-            pool.open_slots = pool.slots - pool.occupied_slots
+            if occupied is not None:
+                pool.occupied_slots = occupied
+            if queued is not None:
+                pool.queued_slots = queued
+            if running is not None:
+                pool.running_slots = running
+            self._touch("pools")
             return pool
         return None
 
     def add_variable(self, variable: Variable) -> None:
         """Add or update a variable."""
+        if variable.key not in self.variables:
+            self._index_key("variables", variable.key)
         self.variables[variable.key] = variable
+        self._touch("variables")
+
+    def create_variable(self, variable: Variable) -> bool:
+        """Add a new variable. Returns True if added, False if one already exists."""
+        if self.variables.setdefault(variable.key, variable) is not variable:
+            return False
+        self._index_key("variables", variable.key)
+        self._touch("variables")
+        return True
+
+    def update_variable(self, variable: Variable) -> bool:
+        """Replace an existing variable. Returns True if updated, False if not found."""
+        if variable.key not in self.variables:
+            return False
+        self.add_variable(variable)
+        return True
 
     def get_variable(self, key: str) -> Optional[Variable]:
         """Get a variable by key."""
@@ -216,35 +567,42 @@ class InstanceStore:
         limit: Optional[int] = None,
         offset: Optional[int] = None,
         order_by: Optional[str] = None,
-    ) -> List[Variable]:
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Variable], int]:
         """List variables with optional pagination and ordering."""
-        variables = list(self.variables.values())
-        
-        # Apply ordering if specified
-        if order_by:
-            reverse = order_by.startswith('-')
-            key = order_by[1:] if reverse else order_by
-            variables.sort(key=lambda x: getattr(x, key), reverse=reverse)
-            
-        # Apply pagination
-        if offset is not None:
-            variables = variables[offset:]
-        if limit is not None:
-            variables = variables[:limit]
-            
-        return variables
+        return self._list_page("variables", self.variables, limit, offset, order_by, cursor)
 
     def delete_variable(self, key: str) -> bool:
         """Delete a variable. Returns True if deleted, False if not found."""
         try:
             del self.variables[key]
+            self._unindex_key("variables", key)
+            self._touch("variables")
             return True
         except KeyError:
             return False
 
     def add_connection(self, connection: Connection) -> None:
         """Add or update a connection."""
+        if connection.conn_id not in self.connections:
+            self._index_key("connections", connection.conn_id)
         self.connections[connection.conn_id] = connection
+        self._touch("connections")
+
+    def create_connection(self, connection: Connection) -> bool:
+        """Add a new connection. Returns True if added, False if one already exists."""
+        if self.connections.setdefault(connection.conn_id, connection) is not connection:
+            return False
+        self._index_key("connections", connection.conn_id)
+        self._touch("connections")
+        return True
+
+    def update_connection(self, connection: Connection) -> bool:
+        """Replace an existing connection. Returns True if updated, False if not found."""
+        if connection.conn_id not in self.connections:
+            return False
+        self.add_connection(connection)
+        return True
 
     def get_connection(self, conn_id: str) -> Optional[Connection]:
         """Get a connection by ID."""
@@ -253,27 +611,43 @@ class InstanceStore:
     def list_connections(
         self,
         limit: Optional[int] = None,
-        offset: Optional[int] = None
-    ) -> List[Connection]:
+        offset: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Connection], int]:
         """List connections with optional pagination."""
-        connections = list(self.connections.values())
-        if offset is not None:
-            connections = connections[offset:]
-        if limit is not None:
-            connections = connections[:limit]
-        return connections
+        return self._list_page("connections", self.connections, limit, offset, cursor=cursor)
 
     def delete_connection(self, conn_id: str) -> bool:
         """Delete a connection. Returns True if deleted, False if not found."""
         try:
             del self.connections[conn_id]
+            self._unindex_key("connections", conn_id)
+            self._touch("connections")
             return True
         except KeyError:
             return False
 
     def add_provider(self, provider: Provider) -> None:
         """Add or update a provider."""
+        if provider.package_name not in self.providers:
+            self._index_key("providers", provider.package_name)
         self.providers[provider.package_name] = provider
+        self._touch("providers")
+
+    def create_provider(self, provider: Provider) -> bool:
+        """Add a new provider. Returns True if added, False if one already exists."""
+        if self.providers.setdefault(provider.package_name, provider) is not provider:
+            return False
+        self._index_key("providers", provider.package_name)
+        self._touch("providers")
+        return True
+
+    def update_provider(self, provider: Provider) -> bool:
+        """Replace an existing provider. Returns True if updated, False if not found."""
+        if provider.package_name not in self.providers:
+            return False
+        self.add_provider(provider)
+        return True
 
     def get_provider(self, package_name: str) -> Optional[Provider]:
         """Get a provider by package name."""
@@ -284,28 +658,17 @@ class InstanceStore:
         limit: Optional[int] = None,
         offset: Optional[int] = None,
         order_by: Optional[str] = None,
-    ) -> List[Provider]:
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Provider], int]:
         """List providers with optional pagination and ordering."""
-        providers = list(self.providers.values())
-        
-        # Apply ordering if specified
-        if order_by:
-            reverse = order_by.startswith('-')
-            key = order_by[1:] if reverse else order_by
-            providers.sort(key=lambda x: getattr(x, key), reverse=reverse)
-            
-        # Apply pagination
-        if offset is not None:
-            providers = providers[offset:]
-        if limit is not None:
-            providers = providers[:limit]
-            
-        return providers
+        return self._list_page("providers", self.providers, limit, offset, order_by, cursor)
 
     def delete_provider(self, package_name: str) -> bool:
         """Delete a provider. Returns True if deleted, False if not found."""
         try:
             del self.providers[package_name]
+            self._unindex_key("providers", package_name)
+            self._touch("providers")
             return True
         except KeyError:
             return False
@@ -317,15 +680,18 @@ class InstanceStore:
 
 class MockStore:
     """Global store managing multiple Airflow instance states."""
+
+    __slots__ = ("instances",)
     
     def __init__(self):
         self.instances: Dict[str, InstanceStore] = {}
         
     def get_instance(self, instance_id: str) -> InstanceStore:
         """Get or create an instance store."""
-        if instance_id not in self.instances:
-            self.instances[instance_id] = InstanceStore(instance_id)
-        return self.instances[instance_id]
+        instance = self.instances.get(instance_id)
+        if instance is None:
+            instance = self.instances[instance_id] = InstanceStore(instance_id)
+        return instance
         
     def list_instances(self) -> List[str]:
         """List all instance IDs."""
@@ -5,19 +5,25 @@ import asyncio
 import click
 from airflow_mock.server import server
 
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
 @click.command()
 @click.option("--instance-id", required=True, help="ID of the Airflow instance to start")
 @click.option("--port", default=8080, help="Port to run the server on")
 @click.option("--populate", is_flag=True, help="Populate the instance with sample data")
 def main(instance_id: str, port: int, populate: bool):
     """Start an Airflow mock instance."""
-    loop = asyncio.get_event_loop()
+    # uvicorn traps SIGINT/SIGTERM while serving and shuts down gracefully,
+    # then re-raises the signal once serve() has returned
+    loop_factory = uvloop.new_event_loop if uvloop else None
     try:
-        loop.run_until_complete(server.start_instance(instance_id, port, populate))
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            runner.run(server.start_instance(instance_id, port, populate))
     except KeyboardInterrupt:
-        loop.run_until_complete(server.stop_instance(instance_id))
-    finally:
-        loop.close()
+        pass
 
 if __name__ == "__main__":
     main()
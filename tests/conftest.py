@@ -0,0 +1,22 @@
+"""
+Shared fixtures for the Airflow mock API tests.
+"""
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+from airflow_mock.api import create_app
+from airflow_mock.store import store
+
+@pytest.fixture
+def instance_id() -> str:
+    """A fresh instance ID, so tests never share store state."""
+    return f"test-{uuid.uuid4().hex}"
+
+@pytest.fixture
+def client(instance_id: str) -> TestClient:
+    """Client for an instance populated with sample data."""
+    with TestClient(create_app(instance_id, populate=True)) as test_client:
+        yield test_client
+    store.instances.pop(instance_id, None)
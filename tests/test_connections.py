@@ -0,0 +1,25 @@
+"""
+Tests for the connection endpoints.
+"""
+from airflow_mock.models import Connection
+from airflow_mock.store import store
+
+BIG_INT = 123456789012345678901234567890
+
+def test_listing_renders_ints_wider_than_64_bits(client, instance_id):
+    """One connection with a huge int in extra doesn't break the whole listing."""
+    store.get_instance(instance_id).add_connection(
+        Connection(conn_id="big", conn_type="http", extra={"n": BIG_INT})
+    )
+    response = client.get("/api/v1/connections")
+    assert response.status_code == 200
+    extras = {c["conn_id"]: c["extra"] for c in response.json()["connections"]}
+    assert extras["big"] == {"n": BIG_INT}
+
+def test_single_connection_with_int_wider_than_64_bits(client):
+    """Huge ints in extra round-trip through create and get."""
+    connection = {"conn_id": "big", "conn_type": "http", "extra": {"n": BIG_INT}}
+    response = client.post("/api/v1/connections", json=connection)
+    assert response.status_code == 200
+    assert response.json()["extra"] == {"n": BIG_INT}
+    assert client.get("/api/v1/connections/big").json()["extra"] == {"n": BIG_INT}
@@ -0,0 +1,41 @@
+"""
+Tests for the DAG run endpoints.
+"""
+DAG_ID = "example_dag_0"
+RUNS_URL = f"/api/v1/dags/{DAG_ID}/dagRuns"
+
+def test_timezone_aware_run_alongside_naive_sample_runs(client):
+    """Aware execution dates are indexed next to the naive sample dates."""
+    run = {"dag_id": DAG_ID, "run_id": "manual_1", "execution_date": "2099-01-01T00:00:00+02:00"}
+    assert client.post(RUNS_URL, json=run).status_code == 200
+    assert client.get(f"{RUNS_URL}/manual_1").status_code == 200
+
+    listed = client.get(RUNS_URL).json()
+    assert listed["total_entries"] == 4
+    assert listed["dag_runs"][-1]["run_id"] == "manual_1"
+
+    run["state"] = "success"
+    assert client.patch(f"{RUNS_URL}/manual_1", json=run).status_code == 200
+    listed = client.get(RUNS_URL, params={"state": "success"}).json()
+    assert "manual_1" in [dr["run_id"] for dr in listed["dag_runs"]]
+
+def test_execution_date_filters_accept_aware_bounds(client):
+    """Aware filter bounds compare against naive stored dates as UTC."""
+    run = {"dag_id": DAG_ID, "run_id": "manual_1", "execution_date": "2099-01-01T01:00:00+02:00"}
+    client.post(RUNS_URL, json=run)
+
+    listed = client.get(RUNS_URL, params={"execution_date_gte": "2098-12-31T23:00:00Z"}).json()
+    assert [dr["run_id"] for dr in listed["dag_runs"]] == ["manual_1"]
+    listed = client.get(RUNS_URL, params={"execution_date_gte": "2098-12-31T23:00:01Z"}).json()
+    assert listed["total_entries"] == 0
+
+def test_listing_renders_ints_wider_than_64_bits(client):
+    """One run with a huge int in conf doesn't break the DAG's run listing."""
+    big = 123456789012345678901234567890
+    run = {"dag_id": DAG_ID, "run_id": "manual_1", "conf": {"n": big}}
+    assert client.post(RUNS_URL, json=run).status_code == 200
+
+    response = client.get(RUNS_URL)
+    assert response.status_code == 200
+    confs = {dr["run_id"]: dr["conf"] for dr in response.json()["dag_runs"]}
+    assert confs["manual_1"] == {"n": big}
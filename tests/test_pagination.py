@@ -0,0 +1,44 @@
+"""
+Tests for pagination of the keyed collection endpoints.
+"""
+import pytest
+
+@pytest.mark.parametrize("path", ["/api/v1/variables", "/api/v1/pools", "/api/v1/providers"])
+def test_cursor_with_other_ordering_is_rejected(client, path):
+    """A cursor only works with the natural key order."""
+    response = client.get(path, params={"cursor": "", "order_by": "description"})
+    assert response.status_code == 400
+    assert response.json()["detail"].startswith("Cursor pagination requires ordering by")
+
+def test_cursor_walks_variables_in_key_order(client):
+    """Following next_cursor visits every variable once, in key order."""
+    seen = []
+    params = {"limit": 2, "cursor": ""}
+    while True:
+        body = client.get("/api/v1/variables", params=params).json()
+        seen.extend(v["key"] for v in body["variables"])
+        if not body["next_cursor"]:
+            break
+        params["cursor"] = body["next_cursor"]
+    assert seen == sorted(seen) == ["api_key", "batch_size", "env"]
+
+@pytest.mark.parametrize("path", ["/api/v1/connections", "/api/v1/variables", "/api/v1/pools", "/api/v1/providers"])
+@pytest.mark.parametrize("params", [{"offset": -1}, {"limit": -1}, {"limit": 0}])
+def test_out_of_range_paging_is_a_validation_error(client, path, params):
+    """Negative offsets and non-positive limits are rejected before reaching the store."""
+    assert client.get(path, params=params).status_code == 422
+
+def test_descending_order_pages_from_the_end(client):
+    """Descending pages walk the key order backwards."""
+    params = {"order_by": "-key", "limit": 2, "offset": 1}
+    body = client.get("/api/v1/variables", params=params).json()
+    assert [v["key"] for v in body["variables"]] == ["batch_size", "api_key"]
+
+def test_descending_order_keeps_ties_in_insertion_order(client):
+    """Pools with equal slots stay in insertion order when sorted by -slots."""
+    for name in ("tie_a", "tie_b", "tie_c"):
+        assert client.post("/api/v1/pools", json={"name": name, "slots": 7}).status_code == 200
+    pools = client.get("/api/v1/pools", params={"limit": 100}).json()["pools"]
+    expected = [p["name"] for p in sorted(pools, key=lambda p: p["slots"], reverse=True)]
+    body = client.get("/api/v1/pools", params={"order_by": "-slots", "limit": 100}).json()
+    assert [p["name"] for p in body["pools"]] == expected
@@ -0,0 +1,29 @@
+"""
+Tests for the task instance endpoints.
+"""
+from airflow_mock.store import store
+
+DAG_ID = "example_dag_0"
+
+def _run_url(client, instance_id):
+    run_id = store.get_instance(instance_id).list_dag_runs(DAG_ID, 1)[0][0].run_id
+    return f"/api/v1/dags/{DAG_ID}/dagRuns/{run_id}/taskInstances"
+
+def _task_ids(client, url, **params):
+    return [ti["task_id"] for ti in client.get(url, params=params).json()["task_instances"]]
+
+def test_state_filter_keeps_run_order(client, instance_id):
+    """Moving a task between states doesn't reorder the state-filtered listing."""
+    url = _run_url(client, instance_id)
+    for task_id in ("task_0", "task_1", "task_2", "task_3"):
+        client.post(f"{url}/{task_id}/setTaskInstanceState", json={"state": "success"})
+    client.post(f"{url}/task_0/setTaskInstanceState", json={"state": "failed"})
+    client.post(f"{url}/task_0/setTaskInstanceState", json={"state": "success"})
+
+    assert _task_ids(client, url, state="success") == _task_ids(client, url)
+    assert _task_ids(client, url, state="success", limit=2, offset=1) == ["task_1", "task_2"]
+
+def test_listing_is_valid_json(client, instance_id):
+    """The hand-built collection envelope parses and counts every task."""
+    body = client.get(_run_url(client, instance_id)).json()
+    assert body["total_entries"] == len(body["task_instances"]) == 4
@@ -0,0 +1,64 @@
+"""
+Tests for the XCom endpoints.
+"""
+from airflow_mock.store import store
+
+BIG_INT = 123456789012345678901234567890
+XCOMS_URL = "/api/v1/dags/example_dag_0/dagRuns/run_1/taskInstances/task_0/xcomEntries"
+
+def _xcoms_url(task_id: str, run_id: str) -> str:
+    return f"/api/v1/dags/example_dag_0/dagRuns/{run_id}/taskInstances/{task_id}/xcomEntries"
+
+def test_entry_with_int_wider_than_64_bits(client):
+    """Huge XCom values round-trip through create and get."""
+    xcom = {"key": "big", "value": BIG_INT, "dag_id": "example_dag_0", "task_id": "task_0", "run_id": "run_1"}
+    response = client.post(XCOMS_URL, json=xcom)
+    assert response.status_code == 200
+    assert response.json()["value"] == BIG_INT
+
+    response = client.get(f"{XCOMS_URL}/big")
+    assert response.status_code == 200
+    assert response.json()["value"] == BIG_INT
+
+def test_listing_renders_ints_wider_than_64_bits(client):
+    """One huge XCom value doesn't break the listing for the whole task."""
+    for key, value in (("small", 1), ("big", BIG_INT)):
+        xcom = {"key": key, "value": value, "dag_id": "example_dag_0", "task_id": "task_0", "run_id": "run_1"}
+        client.post(XCOMS_URL, json=xcom)
+
+    response = client.get(XCOMS_URL)
+    assert response.status_code == 200
+    values = {x["key"]: x["value"] for x in response.json()["xcom_entries"]}
+    assert values == {"small": 1, "big": BIG_INT}
+
+def test_listing_reflects_deletes(client):
+    """The cached listing is re-rendered after an XCom is deleted."""
+    xcom = {"key": "k", "value": 1, "dag_id": "example_dag_0", "task_id": "task_0", "run_id": "run_1"}
+    client.post(XCOMS_URL, json=xcom)
+    assert client.get(XCOMS_URL).json()["total_entries"] == 1
+    assert client.delete(f"{XCOMS_URL}/k").status_code == 204
+    assert client.get(XCOMS_URL).json()["total_entries"] == 0
+
+def test_latest_value_with_mixed_naive_and_aware_timestamps(client, instance_id):
+    """An aware timestamp is compared against naive ones as UTC."""
+    xcom = {"key": "k", "value": 1, "dag_id": "example_dag_0", "task_id": "task_0", "run_id": "run_1"}
+    assert client.post(XCOMS_URL, json=xcom).status_code == 200
+    newer = {**xcom, "value": 2, "run_id": "run_2", "timestamp": "2030-01-01T00:00:00Z"}
+    assert client.post(_xcoms_url("task_0", "run_2"), json=newer).status_code == 200
+
+    latest = store.get_instance(instance_id).get_xcom_value("example_dag_0", "task_0", "k")
+    assert latest.value == 2
+
+def test_listing_is_scoped_to_the_task_and_run(client):
+    """The listing returns every key of this task and run, and nothing else."""
+    for task_id, run_id, key in (("task_0", "run_1", "a"), ("task_0", "run_1", "b"),
+                                 ("task_0", "run_2", "a"), ("task_1", "run_1", "a")):
+        xcom = {"key": key, "value": 1, "dag_id": "example_dag_0", "task_id": task_id, "run_id": run_id}
+        client.post(_xcoms_url(task_id, run_id), json=xcom)
+
+    entries = client.get(XCOMS_URL).json()["xcom_entries"]
+    assert [(x["task_id"], x["run_id"], x["key"]) for x in entries] == [
+        ("task_0", "run_1", "a"), ("task_0", "run_1", "b"),
+    ]
+    assert client.delete(f"{XCOMS_URL}/a").status_code == 204
+    assert [x["key"] for x in client.get(XCOMS_URL).json()["xcom_entries"]] == ["b"]